@@ -1,17 +1,164 @@
 import argparse
+import gzip
+import json
+import math
+import mimetypes
 import os
+import string
 import sys
+import ijson
 import requests
-import xml.etree.ElementTree as ET
+import urllib3
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from email.utils import formatdate
-from urllib.parse import quote_plus
+from email.utils import format_datetime
+from functools import lru_cache
+from itertools import chain, islice
+from html import escape
+from urllib.parse import urlencode, urlsplit
+from xml.sax.saxutils import escape as xml_escape, quoteattr
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of fully buffered responses
+    orjson = None
+
+
+# Shared HTTP session so every AMO request reuses pooled keep-alive connections.
+# The pool is sized for concurrent page fetches: up to 4 --types workers,
+# each fetching up to _MAX_PAGE_WORKERS pages at once.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "amo-addons-rss/1.0 (+https://github.com/cm-fy/amo-add-ons-rss)",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Shared read-only default for missing nested dicts (eg. `current_version`),
+# so lookups don't allocate a fresh `{}` per addon. Never mutate it.
+_EMPTY = {}
+
+# Key under which _get_created_dt memoizes its result on an addon dict; an
+# object() can never collide with a key decoded from JSON
+_CREATED_DT = object()
+
+# Fallback keys probed in order for a field; the first truthy value wins.
+# Resolved with next(filter(None, map(addon.get, keys))), which runs in C.
+_ICON_KEYS = ('icon_url', 'thumbnail_url', 'preview_url')
+_USERS_KEYS = ('average_daily_users', 'weekly_downloads', 'users', 'user_count')
+_HOMEPAGE_KEYS = ('homepage', 'homepage_url', 'website', 'url')
+
+# Enclosure MIME types keyed by lower-cased icon file extension
+_EXT_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+}
+
+# Feed header up to and including the channel metadata, and the matching
+# footer. Both are identical for every run, so they are written verbatim
+# around the streamed items. The feed image lets readers show a custom
+# icon/logo; update its URLs if the Pages URL changes.
+_CHANNEL_PREFIX = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n"
+    b'<rss version="2.0"><channel>'
+    b'<title>Latest Mozilla Add-on Releases</title>'
+    b'<description>RSS feed of the latest add-on updates from Mozilla Add-ons (AMO)</description>'
+    b'<link>https://addons.mozilla.org/</link>'
+    b'<language>en-us</language>'
+    b'<image>'
+    b'<url>https://cm-fy.github.io/amo-add-ons-rss/favicon.png</url>'
+    b'<title>AMO Add-ons RSS</title>'
+    b'<link>https://cm-fy.github.io/amo-add-ons-rss/</link>'
+    b'</image>'
+)
+_CHANNEL_SUFFIX = b'</channel></rss>'
+
+# Version of the generated feed layout, saved with the HTTP cache. Bump it
+# whenever the output changes, so the next run regenerates the feed instead
+# of keeping the old one on a 304.
+_FEED_FORMAT = 1
+
+_AMO_SEARCH_API = 'https://addons.mozilla.org/api/v5/addons/search/'
+
+# Errors raised while a response body is read and decoded: the connection
+# dropping or timing out mid-body, or a truncated/malformed JSON document
+_BODY_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError, ValueError)
+
+# Upper bound on result pages fetched concurrently once the total is known
+_MAX_PAGE_WORKERS = 4
+
+# Output buffer large enough to hold a typical feed (a few hundred KB), so
+# it reaches disk in a single write syscall when the file is closed while
+# items are still streamed into it one at a time.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Translation table deleting every ASCII character that is not allowed in
+# the type label used for output filenames (letters, digits, '_' and '-')
+_LABEL_DELETE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128)) if ch not in string.ascii_letters + string.digits + '_-'
+))
+
+# AMO timestamps are ISO 8601 with a trailing 'Z'. ciso8601 parses them in C
+# when it is installed; otherwise fromisoformat accepts 'Z' from Python 3.11
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value):
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                # fallback: fractional seconds older fromisoformat rejects
+                return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value):
+    """Parse an AMO timestamp string, memoized by the raw value.
+
+    The same `last_updated`/version `created` strings recur across an addon
+    list, and the max_days filter and pubDate parse the same fields. AMO
+    timestamps are UTC, so a value without an offset is treated as UTC and
+    every result can be compared with an aware datetime.
+    """
+    dt = _parse_iso(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@lru_cache(maxsize=64)
+def _mime_for(ext):
+    """Return the image MIME type for a file extension, defaulting to PNG.
+
+    Common icon extensions come from `_EXT_MIME`; anything else is resolved
+    through `mimetypes` once and cached, since extensions repeat across addons.
+    """
+    mime = _EXT_MIME.get(ext) or mimetypes.guess_type('icon' + ext)[0]
+    return mime if mime and mime.startswith('image/') else 'image/png'
 
 
 def _best_locale_value(maybe_localized):
-    if isinstance(maybe_localized, dict):
-        return maybe_localized.get('en-US') or maybe_localized.get('en') or next(iter(maybe_localized.values()), '')
-    return maybe_localized or ''
+    # Called for name/summary of every addon: exact type checks and plain
+    # loops avoid allocating an iterator when en-US/en is present. Always
+    # returns a str, since callers HTML-escape the result directly.
+    if type(maybe_localized) is dict:
+        value = maybe_localized.get('en-US') or maybe_localized.get('en')
+        if not value:
+            for value in maybe_localized.values():
+                break
+        maybe_localized = value
+    if not maybe_localized:
+        return ''
+    return maybe_localized if type(maybe_localized) is str else str(maybe_localized)
 
 
 def _format_homepage(maybe_homepage):
@@ -33,13 +180,11 @@ def _format_homepage(maybe_homepage):
         # common shape: {'url': {'en-US': 'https://...'}, 'outgoing': {...}}
         url_field = maybe_homepage.get('url') or maybe_homepage.get('homepage')
         if isinstance(url_field, dict):
-            # pick the first locale key to display but keep the locale label
-            try:
-                locale_key = next(iter(url_field.keys()))
-                locale_val = url_field.get(locale_key) or ''
-                return f"Homepage ({locale_key}): {locale_val}"
-            except StopIteration:
-                pass
+            # pick the first locale key to display but keep the locale label;
+            # the loop returns on the first pair, so no separate .get() or
+            # try/except StopIteration is needed
+            for locale_key, locale_val in url_field.items():
+                return f"Homepage ({locale_key}): {locale_val or ''}"
 
         if isinstance(url_field, str):
             return url_field
@@ -47,12 +192,8 @@ def _format_homepage(maybe_homepage):
         # fallback: check for 'outgoing' which may be a dict similar to 'url'
         outgoing = maybe_homepage.get('outgoing')
         if isinstance(outgoing, dict):
-            try:
-                locale_key = next(iter(outgoing.keys()))
-                locale_val = outgoing.get(locale_key)
+            for locale_key, locale_val in outgoing.items():
                 return f"Homepage ({locale_key}): {locale_val}"
-            except StopIteration:
-                pass
 
     # Last resort: string representation
     try:
@@ -61,377 +202,501 @@ def _format_homepage(maybe_homepage):
         return ''
 
 
-def generate_rss_feed(search_url=None, amo_type=None, q=None, page_size=50, max_items=None, max_days=None):
-    """
-    Generate RSS feed from AMO search API.
+def _json_loads(body):
+    """Decode a complete JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
 
-    - If `search_url` is provided, it will be used verbatim.
-    - Otherwise a search URL is built using `amo_type` and `q` parameters.
-    - Writes `public/amo_latest_addons.xml` always and, when `amo_type` is given,
-      also writes `public/amo_latest_{amo_type}s.xml`.
+
+def _iter_page_results(fp, page_info):
+    """Yield addon dicts from an AMO search response body as they are parsed.
+
+    `fp` is a file-like object over the raw JSON; top-level pagination fields
+    (eg. `next`) are recorded into `page_info` while the results stream by.
     """
+    builder = None
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'results.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == 'results.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix in ('next', 'count') and event != 'map_key':
+            page_info[prefix] = value
+
+
+def _extract_icon_url(addon):
+    # Try to find an icon URL in several possible shapes returned by AMO
+    icon_url = None
+    icons = addon.get('icons')
+    if isinstance(icons, dict):
+        for size in ('64', '48', '32', '16'):
+            if icons.get(size):
+                icon_url = icons.get(size)
+                break
+        if not icon_url:
+            # fallback to any value
+            icon_url = next(iter(icons.values()), None)
+    elif isinstance(icons, list) and icons:
+        first = icons[0]
+        if isinstance(first, dict):
+            icon_url = first.get('url') or first.get('src')
+        else:
+            icon_url = first
+    icon_url = icon_url or next(filter(None, map(addon.get, _ICON_KEYS)), None)
+    # Only a string URL is usable for the <img> and <enclosure> that embed it
+    return icon_url if isinstance(icon_url, str) else None
 
-    headers = {"User-Agent": "amo-addons-rss/1.0 (+https://github.com/cm-fy/amo-add-ons-rss)"}
 
-    collected = []
+def _extract_author(addon):
+    authors = addon.get('authors') or []
+    if isinstance(authors, list) and authors:
+        first_author = authors[0]
+        if isinstance(first_author, dict):
+            return first_author.get('name') or ''
+        return str(first_author)
+    return ''
 
-    # Helper to fetch pages following AMO's `next` links when present
-    def _fetch_following(url):
-        nonlocal collected
-        while url:
-            try:
-                resp = requests.get(url, headers=headers, timeout=30)
-            except Exception as e:
-                print(f"Failed to fetch data from AMO API: {e}")
-                break
 
-            if resp.status_code != 200:
-                print(f"Failed to fetch data from AMO API: {resp.status_code}")
-                break
+def _extract_min_firefox_version(a):
+    """Extract Firefox minimum version compatibility from latest version info."""
+    try:
+        cv = a.get('current_version') or _EMPTY
+        # common place: cv['compatibility']
+        compat = cv.get('compatibility') or _EMPTY
+        if isinstance(compat, dict):
+            f = compat.get('firefox') or compat.get('firefox_desktop')
+            if isinstance(f, dict):
+                mv = f.get('min_version') or f.get('min')
+                if mv:
+                    return str(mv)
+
+        # files -> applications
+        files = cv.get('files') or []
+        if files and isinstance(files, list):
+            for fobj in files:
+                apps = fobj.get('applications') or fobj.get('application') or _EMPTY
+                if isinstance(apps, dict):
+                    firefox = apps.get('firefox') or apps.get('firefox-desktop') or apps.get('firefox_android')
+                    if isinstance(firefox, dict):
+                        mv = firefox.get('min_version') or firefox.get('min')
+                        if mv:
+                            return str(mv)
 
-            data = resp.json()
-            results = data.get('results', [])
-            if not results:
-                break
+        # file -> applications
+        file0 = cv.get('file') or _EMPTY
+        if isinstance(file0, dict):
+            apps = file0.get('applications') or _EMPTY
+            if isinstance(apps, dict):
+                firefox = apps.get('firefox')
+                if isinstance(firefox, dict):
+                    mv = firefox.get('min_version') or firefox.get('min')
+                    if mv:
+                        return str(mv)
+    except Exception:
+        pass
+    return ''
 
-            collected.extend(results)
 
-            # Stop when we've fetched enough items if max_items is set
-            if max_items and len(collected) >= int(max_items):
-                break
+def _get_created_dt(a):
+    """Return the addon's created/updated timestamp as a datetime, or None.
 
-            # Follow AMO-provided next link if available
-            next_url = data.get('next')
-            if next_url:
-                url = next_url
+    Used both for pubDate and for the max_days filter, so the result is
+    memoized on the addon dict and the fields are only walked once per addon.
+    """
+    try:
+        return a[_CREATED_DT]
+    except KeyError:
+        pass
+
+    # Attempt several fields to find a created/updated timestamp
+    dt = None
+    cv = a.get('current_version') or _EMPTY
+    for candidate in (
+        (cv.get('file') or _EMPTY).get('created'),
+        cv.get('created'),
+        a.get('last_updated'),
+        a.get('created'),
+    ):
+        if candidate:
+            try:
+                dt = _parse_timestamp(candidate)
+                break
+            except Exception:
                 continue
 
-            # No 'next' link: if this was a constructed paged URL, fall back
-            break
+    a[_CREATED_DT] = dt
+    return dt
+
+
+def _item_context(addon):
+    """Resolve the values shared by several <item> fields, once per addon."""
+    cv = addon.get('current_version') or _EMPTY
+    return {
+        'cv': cv,
+        'name': _best_locale_value(addon.get('name')),
+        'version': str(cv.get('version') or ''),
+        'icon_url': _extract_icon_url(addon),
+        'author': _extract_author(addon),
+    }
+
+
+def _extract_title(addon, ctx):
+    title_name = ctx['name']
+    version = ctx['version']
+    return f"{title_name} v{version}" if title_name or version else 'Unknown'
+
+
+def _extract_description(addon, ctx):
+    """Build a richer HTML description including icon and metadata."""
+    cv = ctx['cv']
+    title_name = ctx['name']
+    version = ctx['version']
+    summary = _best_locale_value(addon.get('summary')) or 'No description available'
+    icon_url = ctx['icon_url']
+
+    # Gather additional metadata when available
+    author_name = ctx['author']
+    users = next(filter(None, map(addon.get, _USERS_KEYS)), '')
+    # rating may appear in various places
+    rating = None
+    try:
+        rating = cv.get('rating') or addon.get('rating') or addon.get('average_rating')
+    except Exception:
+        rating = None
 
-    # Normalize requested type for API vs filename (allow aliases like "theme")
-    api_type = None
-    file_label = None
-    if amo_type:
-        at = str(amo_type).lower()
-        if at in ('theme', 'themes'):
-            api_type = 'statictheme'
-            file_label = 'theme'
+    categories = []
+    for cat in addon.get('categories') or []:
+        if isinstance(cat, dict):
+            categories.append(cat.get('name') or cat.get('slug') or '')
         else:
-            api_type = at
-            # ensure a singular label for filenames (e.g. 'extension' -> 'extension')
-            file_label = at[:-1] if at.endswith('s') else at
+            categories.append(str(cat))
+
+    permissions = addon.get('permissions') or addon.get('required_permissions') or []
+    homepage = next(filter(None, map(addon.get, _HOMEPAGE_KEYS)), None)
+    addon_id = addon.get('id') or addon.get('slug') or ''
+    min_firefox = _extract_min_firefox_version(addon)
+
+    meta_items = []
+    if author_name:
+        meta_items.append(f'Author: {author_name}')
+    if users:
+        meta_items.append(f'Users: {users}')
+    if rating:
+        meta_items.append(f'Rating: {rating}')
+    if categories:
+        meta_items.append('Categories: ' + ', '.join([c for c in categories if c]))
+    if permissions:
+        # permissions may be a list or string
+        if isinstance(permissions, (list, tuple)):
+            perms = ', '.join(str(p) for p in permissions)
+        else:
+            perms = str(permissions)
+        meta_items.append('Permissions: ' + perms)
+    if homepage:
+        hp = _format_homepage(homepage)
+        if hp:
+            # _format_homepage may already include the "Homepage (... )" prefix
+            meta_items.append(hp if hp.lower().startswith('homepage') else f'Homepage: {hp}')
+    if min_firefox:
+        meta_items.append(f'Works with Firefox: {min_firefox} and later')
+    if addon_id:
+        meta_items.append(f'ID: {addon_id}')
 
-    # If the caller provided a full search URL, follow its `next` links
-    if search_url:
-        _fetch_following(search_url)
-    else:
-        base = 'https://addons.mozilla.org/api/v5/addons/search/'
-        page = 1
-        while True:
-            params = []
-            params.append('sort=updated')
-            params.append(f'page_size={int(page_size)}')
-            params.append(f'page={page}')
-            if api_type:
-                params.append(f'type={quote_plus(str(api_type))}')
-            if q:
-                params.append(f'q={quote_plus(str(q))}')
-            api_url = base + '?' + '&'.join(params)
+    # Compose the HTML description in one pass; many feed readers accept HTML in
+    # descriptions. AMO values are plain text, so they are HTML-escaped once here
+    # and the result is emitted as CDATA (see _cdata).
+    icon_html = ''
+    if icon_url:
+        icon_html = f'<img src="{escape(icon_url)}" alt="icon" style="float:left;margin:0 10px 6px 0;width:64px;height:64px;"/>'
 
-            try:
-                resp = requests.get(api_url, headers=headers, timeout=30)
-            except Exception as e:
-                print(f"Failed to fetch data from AMO API: {e}")
-                break
+    # Title and version already set in <title>, but include a header here
+    version_html = f' v{escape(version)}' if version else ''
 
-            if resp.status_code != 200:
-                print(f"Failed to fetch data from AMO API: {resp.status_code}")
-                break
+    meta_html = ''
+    if meta_items:
+        # Use a slightly lighter grey so the footer is readable in dark themes
+        meta_html = '<div style="margin-top:6px;color:#9aa0a6;font-size:0.95em;">' + escape(' • '.join(meta_items)) + '</div>'
 
-            data = resp.json()
-            results = data.get('results', [])
-            if not results:
-                break
+    return (
+        f'{icon_html}<div><strong>{escape(title_name)}{version_html}</strong></div>'
+        f'<div>{escape(summary)}</div>{meta_html}'
+    )
 
-            collected.extend(results)
 
-            # Stop when we've fetched enough items if max_items is set
-            if max_items and len(collected) >= int(max_items):
-                break
+def _extract_link(addon, ctx):
+    return f"https://addons.mozilla.org/en-US/firefox/addon/{addon.get('slug', '')}/"
 
-            # Follow AMO-provided next link if available
-            next_url = data.get('next')
-            if next_url:
-                # continue from the provided next URL
-                _fetch_following(next_url)
-                break
 
-            # If fewer results than page_size, we've reached the end
-            if len(results) < int(page_size):
-                break
+def _extract_item_author(addon, ctx):
+    return ctx['author']
 
-            page += 1
 
-    # If max_days is supplied, filter out older addons
-    if max_days:
-        def _get_created_dt(a):
-            # Attempt several fields to find a created/updated timestamp
-            for candidate in (
-                a.get('current_version', {}).get('file', {}).get('created'),
-                a.get('current_version', {}).get('created'),
-                a.get('last_updated'),
-                a.get('created'),
-            ):
-                if candidate:
-                    try:
-                        return datetime.fromisoformat(candidate.replace('Z', '+00:00'))
-                    except Exception:
-                        try:
-                            # fallback: try parsing common formats
-                            return datetime.strptime(candidate, '%Y-%m-%dT%H:%M:%S.%fZ')
-                        except Exception:
-                            continue
-            return None
-
-        cutoff = datetime.utcnow() - timedelta(days=int(max_days))
-        filtered = []
-        for a in collected:
-            dt = _get_created_dt(a)
-            if dt is None or dt >= cutoff:
-                filtered.append(a)
-        collected = filtered
+def _extract_guid(addon, ctx):
+    return addon.get('slug') or str(addon.get('id') or '')
 
-    addons = collected
 
-    # Create RSS root
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
+# Control characters that are not allowed anywhere in an XML 1.0 document.
+_XML_INVALID = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D))
 
-    # Channel metadata
-    title = ET.SubElement(channel, "title")
-    title.text = "Latest Mozilla Add-on Releases"
 
-    description = ET.SubElement(channel, "description")
-    description.text = "RSS feed of the latest add-on updates from Mozilla Add-ons (AMO)"
+def _xml_text(value):
+    return xml_escape(value.translate(_XML_INVALID))
 
-    link = ET.SubElement(channel, "link")
-    link.text = "https://addons.mozilla.org/"
 
-    language = ET.SubElement(channel, "language")
-    language.text = "en-us"
+def _cdata(value):
+    # a literal ']]>' would end the section early, so split it across two
+    return '<![CDATA[' + value.translate(_XML_INVALID).replace(']]>', ']]]]><![CDATA[>') + ']]>'
 
-    # Add feed image so feed readers can show a custom icon/logo
+
+# Text-only <item> children, in output order. Each extractor takes the addon
+# dict and its _item_context() and returns the element text, or a falsy value
+# to omit the element; the serializer turns that text into the element's
+# escaped content.
+FIELD_EXTRACTORS = (
+    ('title', _extract_title, _xml_text),
+    ('description', _extract_description, _cdata),
+    ('link', _extract_link, _xml_text),
+    ('author', _extract_item_author, _xml_text),
+    ('guid', _extract_guid, _xml_text),
+)
+
+
+def _build_item(addon, pub_dates):
+    """Serialize a single AMO addon as a UTF-8 encoded <item> fragment.
+
+    Any parsed pubDate is appended to `pub_dates` so the caller can report
+    the newest item once the whole feed has been written.
+    """
+    ctx = _item_context(addon)
+    parts = ['<item>']
+    append = parts.append
+    for tag, fn, serialize in FIELD_EXTRACTORS:
+        val = fn(addon, ctx)
+        if val:
+            append(f'<{tag}>{serialize(val)}</{tag}>')
+
+    pub_date = _get_created_dt(addon)
+    if pub_date is not None:
+        append(f'<pubDate>{format_datetime(pub_date.astimezone(timezone.utc), usegmt=True)}</pubDate>')
+        pub_dates.append(pub_date)
+
+    # Add enclosure for the icon when available (helps some feed readers show thumbnails)
+    icon_url = ctx['icon_url']
+    if icon_url:
+        # infer type from the extension of the URL path's last segment; the
+        # host, query string and fragment are never considered, and a URL
+        # without a path falls back to the default type
+        ext = os.path.splitext(urlsplit(icon_url).path)[1].lower()
+        append(f'<enclosure url={quoteattr(icon_url.translate(_XML_INVALID))} type="{_mime_for(ext)}"/>')
+
+    append('</item>')
+    return ''.join(parts).encode('utf-8')
+
+
+def _load_http_cache(path):
+    """Return the HTTP validators saved by the previous run, or {}."""
     try:
-        # Absolute URL to the site's favicon; update if your Pages URL changes
-        feed_image_url = 'https://cm-fy.github.io/amo-add-ons-rss/favicon.png'
-        image_el = ET.SubElement(channel, 'image')
-        url_el = ET.SubElement(image_el, 'url')
-        url_el.text = feed_image_url
-        title_el = ET.SubElement(image_el, 'title')
-        title_el.text = 'AMO Add-ons RSS'
-        link_el = ET.SubElement(image_el, 'link')
-        link_el.text = 'https://cm-fy.github.io/amo-add-ons-rss/'
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
     except Exception:
-        pass
+        return {}
 
-    # Add items
-    pub_dates = []
-    for addon in addons:
-        item = ET.SubElement(channel, "item")
-
-        item_title = ET.SubElement(item, "title")
-        title_name = _best_locale_value(addon.get('name'))
-        version = addon.get('current_version', {}).get('version', '')
-        item_title.text = f"{title_name} v{version}" if title_name or version else 'Unknown'
-
-        # Build a richer HTML description including icon and metadata
-        summary = _best_locale_value(addon.get('summary')) or 'No description available'
-
-        # Try to find an icon URL in several possible shapes returned by AMO
-        icon_url = None
-        icons = addon.get('icons')
-        if isinstance(icons, dict):
-            for size in ('64', '48', '32', '16'):
-                if icons.get(size):
-                    icon_url = icons.get(size)
-                    break
-            if not icon_url:
-                # fallback to any value
-                icon_url = next(iter(icons.values()), None)
-        elif isinstance(icons, list) and icons:
-            first = icons[0]
-            if isinstance(first, dict):
-                icon_url = first.get('url') or first.get('src')
-            else:
-                icon_url = first
-        icon_url = icon_url or addon.get('icon_url') or addon.get('thumbnail_url') or addon.get('preview_url')
-
-        # Gather additional metadata when available
-        authors = addon.get('authors') or []
-        author_name = ''
-        if isinstance(authors, list) and authors:
-            first_author = authors[0]
-            if isinstance(first_author, dict):
-                author_name = first_author.get('name') or ''
-            else:
-                author_name = str(first_author)
-
-        users = addon.get('average_daily_users') or addon.get('weekly_downloads') or addon.get('users') or addon.get('user_count') or ''
-        # rating may appear in various places
-        rating = None
+
+def _save_http_cache(path, cache):
+    """Persist HTTP validators for the next run; drop the file when there are none."""
+    if cache.get('etag') or cache.get('last_modified'):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _check_freshness(newest_pub):
+    # Optional freshness check controlled by AMO_MAX_STALE_HOURS (hours)
+    max_stale = os.environ.get('AMO_MAX_STALE_HOURS')
+    if max_stale:
         try:
-            rating = addon.get('current_version', {}).get('rating') or addon.get('rating') or addon.get('average_rating')
-        except Exception:
-            rating = None
-
-        categories = []
-        for cat in addon.get('categories') or []:
-            if isinstance(cat, dict):
-                categories.append(cat.get('name') or cat.get('slug') or '')
-            else:
-                categories.append(str(cat))
-
-        permissions = addon.get('permissions') or addon.get('required_permissions') or []
-        homepage = addon.get('homepage') or addon.get('homepage_url') or addon.get('website') or addon.get('url')
-        addon_id = addon.get('id') or addon.get('slug') or ''
-
-        # Try to extract Firefox minimum version compatibility from latest version info
-        def _extract_min_firefox_version(a):
-            try:
-                cv = a.get('current_version') or {}
-                # common place: cv['compatibility']
-                compat = cv.get('compatibility') or {}
-                if isinstance(compat, dict):
-                    f = compat.get('firefox') or compat.get('firefox_desktop')
-                    if isinstance(f, dict):
-                        mv = f.get('min_version') or f.get('min')
-                        if mv:
-                            return str(mv)
+            hours = float(max_stale)
+            if newest_pub:
+                age_hours = (datetime.now(timezone.utc) - newest_pub).total_seconds() / 3600.0
+                if age_hours > hours:
+                    print(f"ERROR: feed newest pubDate {newest_pub.isoformat()} is older than {hours} hours (age {age_hours:.1f}h).")
+                    sys.exit(2)
+        except Exception as e:
+            print(f"Could not evaluate AMO_MAX_STALE_HOURS: {e}")
 
-                # files -> applications
-                files = cv.get('files') or []
-                if files and isinstance(files, list):
-                    for fobj in files:
-                        apps = fobj.get('applications') or fobj.get('application') or {}
-                        if isinstance(apps, dict):
-                            firefox = apps.get('firefox') or apps.get('firefox-desktop') or apps.get('firefox_android')
-                            if isinstance(firefox, dict):
-                                mv = firefox.get('min_version') or firefox.get('min')
-                                if mv:
-                                    return str(mv)
-
-                # file -> applications
-                file0 = cv.get('file') or {}
-                if isinstance(file0, dict):
-                    apps = file0.get('applications') or {}
-                    if isinstance(apps, dict):
-                        firefox = apps.get('firefox')
-                        if isinstance(firefox, dict):
-                            mv = firefox.get('min_version') or firefox.get('min')
-                            if mv:
-                                return str(mv)
-            except Exception:
-                pass
-            return ''
-
-        min_firefox = _extract_min_firefox_version(addon)
-
-        # Compose HTML description (will be escaped in XML); many feed readers accept HTML in descriptions
-        parts = []
-        if icon_url:
-            parts.append(f'<img src="{icon_url}" alt="icon" style="float:left;margin:0 10px 6px 0;width:64px;height:64px;"/>')
-
-        # Title and version already set in <title>, but include a header here
-        header_html = f'<div><strong>{title_name}' + (f' v{version}' if version else '') + '</strong></div>'
-        parts.append(header_html)
-
-        parts.append(f'<div>{summary}</div>')
-
-        meta_items = []
-        if author_name:
-            meta_items.append(f'Author: {author_name}')
-        if users:
-            meta_items.append(f'Users: {users}')
-        if rating:
-            meta_items.append(f'Rating: {rating}')
-        if categories:
-            meta_items.append('Categories: ' + ', '.join([c for c in categories if c]))
-        if permissions:
-            # permissions may be a list or string
-            if isinstance(permissions, (list, tuple)):
-                perms = ', '.join(str(p) for p in permissions)
-            else:
-                perms = str(permissions)
-            meta_items.append('Permissions: ' + perms)
-        if homepage:
-            hp = _format_homepage(homepage)
-            if hp:
-                # _format_homepage may already include the "Homepage (... )" prefix
-                meta_items.append(hp if hp.lower().startswith('homepage') else f'Homepage: {hp}')
-        if min_firefox:
-            meta_items.append(f'Works with Firefox: {min_firefox} and later')
-        if addon_id:
-            meta_items.append(f'ID: {addon_id}')
-
-        if meta_items:
-            # Use a slightly lighter grey so the footer is readable in dark themes
-            parts.append('<div style="margin-top:6px;color:#9aa0a6;font-size:0.95em;">' + ' • '.join(meta_items) + '</div>')
-
-        item_description = ET.SubElement(item, "description")
-        item_description.text = '\n'.join(parts)
-
-        item_link = ET.SubElement(item, "link")
-        item_link.text = f"https://addons.mozilla.org/en-US/firefox/addon/{addon.get('slug', '')}/"
-
-        # Try to derive a pubDate from various possible fields
-        created_str = None
-        for candidate in (
-            addon.get('current_version', {}).get('file', {}).get('created'),
-            addon.get('current_version', {}).get('created'),
-            addon.get('last_updated'),
-            addon.get('created'),
-        ):
-            if candidate:
-                created_str = candidate
-                break
 
-        if created_str:
-            try:
-                pub_date = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-                item_pubdate = ET.SubElement(item, "pubDate")
-                item_pubdate.text = formatdate(pub_date.timestamp())
-                pub_dates.append(pub_date)
-            except Exception:
-                pass
+def _normalize_type(amo_type):
+    """Return the (API type, filename label) pair for a requested AMO type.
+
+    Aliases such as "theme" and "themes" map to the same pair; the label is
+    what names the output file `amo_latest_{label}s.xml`.
+    """
+    at = str(amo_type).lower()
+    if at in ('theme', 'themes'):
+        api_type = 'statictheme'
+        file_label = 'theme'
+    else:
+        api_type = at
+        # ensure a singular label for filenames (e.g. 'extensions' -> 'extension')
+        file_label = at[:-1] if at.endswith('s') else at
+    safe_label = file_label.encode('ascii', 'ignore').decode('ascii').translate(_LABEL_DELETE).lower()
+    return api_type, safe_label
+
+
+def generate_rss_feed(search_url=None, amo_type=None, q=None, page_size=50, max_items=None, max_days=None):
+    """
+    Generate RSS feed from AMO search API.
+
+    - If `search_url` is provided, it will be used verbatim.
+    - Otherwise a search URL is built using `amo_type` and `q` parameters.
+    - Writes `public/amo_latest_addons.xml`, or `public/amo_latest_{amo_type}s.xml`
+      when `amo_type` is given, plus a gzip-compressed `.xml.gz` copy.
+    """
+
+    fetched = 0
+    first_url = None
+    validators = None
+    not_modified = False
+    fetch_failed = False
+
+    # Helper to fetch one results page; addons are yielded as they are parsed,
+    # or after decoding the whole body at once when `stream` is False
+    def _fetch_page(url, page_info, stream=True):
+        nonlocal first_url, validators, not_modified, fetch_failed
+        req_headers = {}
+        if first_url is None:
+            # Only the first page is requested conditionally
+            first_url = url
+            if http_cache.get('url') == url:
+                if http_cache.get('etag'):
+                    req_headers['If-None-Match'] = http_cache['etag']
+                if http_cache.get('last_modified'):
+                    req_headers['If-Modified-Since'] = http_cache['last_modified']
 
-        # Add enclosure for the icon when available (helps some feed readers show thumbnails)
         try:
-            if icon_url:
-                # attempt to infer type from extension
-                t = 'image/png'
-                if icon_url.lower().endswith('.jpg') or icon_url.lower().endswith('.jpeg'):
-                    t = 'image/jpeg'
-                elif icon_url.lower().endswith('.gif'):
-                    t = 'image/gif'
-                ET.SubElement(item, 'enclosure', attrib={'url': icon_url, 'type': t})
-        except Exception:
-            pass
-
-        # Add author element for RSS
-        if author_name:
+            resp = _SESSION.get(url, headers=req_headers, timeout=30, stream=True)
+        except Exception as e:
+            print(f"Failed to fetch data from AMO API: {e}")
+            fetch_failed = True
+            return
+
+        with resp:
+            if resp.status_code == 304 and req_headers:
+                not_modified = True
+                return
+
+            if resp.status_code != 200:
+                print(f"Failed to fetch data from AMO API: {resp.status_code}")
+                fetch_failed = True
+                return
+
+            if url == first_url:
+                validators = {
+                    'etag': resp.headers.get('ETag'),
+                    'last_modified': resp.headers.get('Last-Modified'),
+                }
+
+            resp.raw.decode_content = True
+            # The body is only read here, after get() returned, so a broken
+            # connection or truncated JSON surfaces while it is consumed
             try:
-                ael = ET.SubElement(item, 'author')
-                ael.text = author_name
-            except Exception:
-                pass
+                if stream:
+                    yield from _iter_page_results(resp.raw, page_info)
+                else:
+                    # Read the (decompressed) body straight off the socket in one
+                    # buffer; resp.content would first collect and join chunks
+                    data = _json_loads(resp.raw.read())
+                    page_info['next'] = data.get('next')
+                    page_info['count'] = data.get('count')
+                    yield from data.get('results') or []
+            except _BODY_ERRORS as e:
+                print(f"Failed to fetch data from AMO API: {e}")
+                fetch_failed = True
+                return
+
+    # Fetch the result pages after the first concurrently, once the first page
+    # revealed the total. AMO may cap page_size, so `per_page` is the first
+    # page's real length.
+    def _fetch_remaining_pages(page_url, total, per_page):
+        wanted = min(total, int(max_items)) if max_items else total
+        pages = math.ceil(wanted / per_page)
+        if pages < 2:
+            return
+
+        # Worker threads buffer whole pages anyway, so decode them in one go
+        def _fetch_page_list(url):
+            return list(_fetch_page(url, {}, stream=False))
+
+        # Keep at most one request per worker in flight: a new page is only
+        # submitted once the oldest one is consumed, so a failure or early stop
+        # never leaves a long queue of pages to be fetched and thrown away
+        workers = min(_MAX_PAGE_WORKERS, pages - 1)
+        page_numbers = iter(range(2, pages + 1))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            pending = deque(ex.submit(_fetch_page_list, page_url(page)) for page in islice(page_numbers, workers))
+            try:
+                # Yield pages in order; stop at the first failed or empty page,
+                # and trim the last one so no more than `wanted` items are emitted
+                remaining = wanted - per_page
+                while pending:
+                    results = pending.popleft().result()
+                    if not results:
+                        break
+                    yield from results[:remaining]
+                    remaining -= len(results)
+                    if remaining <= 0:
+                        break
+                    page = next(page_numbers, None)
+                    if page is not None:
+                        pending.append(ex.submit(_fetch_page_list, page_url(page)))
+            finally:
+                # Requests that haven't started are dropped rather than awaited
+                for future in pending:
+                    future.cancel()
+
+    # Single pagination routine: yields addons from `url` onwards, following
+    # AMO's `next` links. When `page_url` builds the URL for a page number and
+    # the first page reports a total, the rest is fetched concurrently instead.
+    def _fetch_following(url, page_url=None):
+        nonlocal fetched
+        limit = int(max_items) if max_items else None
+        while url:
+            page_info = {}
+            page_count = 0
+            for addon in _fetch_page(url, page_info):
+                page_count += 1
+                yield addon
+                # Stop mid-page at the limit; the rest of the body isn't read
+                if limit and fetched + page_count >= limit:
+                    break
+            if not page_count:
+                break
 
-        # Add GUID
-        try:
-            guid = ET.SubElement(item, 'guid')
-            guid.text = addon.get('slug') or str(addon.get('id') or '')
-        except Exception:
-            pass
+            fetched += page_count
+
+            # Stop before the next request once we've fetched enough items
+            if limit and fetched >= limit:
+                break
+
+            total = page_info.get('count')
+            if page_url is not None and total is not None:
+                yield from _fetch_remaining_pages(page_url, int(total), page_count)
+                break
+            page_url = None
+
+            # Follow AMO-provided next link if available
+            url = page_info.get('next')
+
+    # Normalize requested type for API vs filename (allow aliases like "theme")
+    api_type = None
+    if amo_type:
+        api_type, safe_label = _normalize_type(amo_type)
 
     # Ensure output directory exists when run in CI
     outdir = os.path.join(os.getcwd(), 'public')
@@ -440,50 +705,149 @@ def generate_rss_feed(search_url=None, amo_type=None, q=None, page_size=50, max_
     # Write the default feed only when no specific `amo_type` was requested.
     # This prevents a subsequent type-specific run (e.g. --type extension)
     # from overwriting the combined `amo_latest_addons.xml` output.
-    tree = ET.ElementTree(rss)
+    if amo_type:
+        outpath = os.path.join(outdir, f'amo_latest_{safe_label}s.xml')
+    else:
+        outpath = os.path.join(outdir, 'amo_latest_addons.xml')
+
+    # Conditional GET: validators saved by the previous run for the same first
+    # page URL let AMO answer 304 Not Modified when the results are unchanged.
+    # They only apply when the feed was written with the same settings and
+    # format, and both the feed and its gzip copy are still on disk. A max_days
+    # feed also depends on the current time, so it is never kept on a 304.
+    cache_path = os.path.join(outdir, f'.{os.path.splitext(os.path.basename(outpath))[0]}.cache.json')
+    cache_key = {
+        'format': _FEED_FORMAT,
+        'max_items': int(max_items) if max_items else None,
+        'max_days': int(max_days) if max_days else None,
+    }
+    http_cache = {}
+    if not max_days and os.path.exists(outpath) and os.path.exists(outpath + '.gz'):
+        http_cache = _load_http_cache(cache_path)
+        if any(http_cache.get(k) != v for k, v in cache_key.items()):
+            http_cache = {}
+
+    # Encode the fixed search parameters once; only the page number varies
+    params = {'sort': 'updated', 'page_size': int(page_size)}
+    if api_type:
+        params['type'] = api_type
+    if q:
+        params['q'] = q
+    search_query = urlencode(params)
+
+    def _page_url(page):
+        return f'{_AMO_SEARCH_API}?{search_query}&page={page}'
+
+    # If the caller provided a full search URL, follow its `next` links;
+    # otherwise build the paged search URL from the parameters
+    if search_url:
+        addons = _fetch_following(search_url)
+    else:
+        addons = _fetch_following(_page_url(1), page_url=_page_url)
+
+    # Pull the first addon before the output file is touched, so a 304 on the
+    # first request keeps the previous feed without parsing or writing anything
+    first_addon = next(addons, None)
+    if not_modified:
+        newest_pub = _parse_iso(http_cache['newest_pub']) if http_cache.get('newest_pub') else None
+        print(f"AMO results unchanged since last run; keeping {outpath}")
+        _check_freshness(newest_pub)
+        return
+    if first_addon is not None:
+        addons = chain((first_addon,), addons)
+
+    # If max_days is supplied, filter out older addons
+    if max_days:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=int(max_days))
+
+        def _is_recent(a):
+            dt = _get_created_dt(a)
+            return dt is None or dt >= cutoff
+
+        addons = filter(_is_recent, addons)
+
+    # Stream the feed to disk: the constant channel header first, then one
+    # <item> at a time, so only the item currently being built is held in memory.
+    # Every chunk is also teed into a gzip-compressed copy (`.xml.gz`) in the same
+    # pass; mtime=0 keeps the archive byte-identical when the feed is unchanged.
+    # Both are written to temporary files and only moved into place once complete,
+    # so a failed run never leaves a truncated feed behind.
+    gz_outpath = outpath + '.gz'
+    tmp_outpath = outpath + '.tmp'
+    tmp_gz_outpath = gz_outpath + '.tmp'
+
+    def _discard_tmp():
+        for path in (tmp_outpath, tmp_gz_outpath):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    pub_dates = []
+    items_count = 0
+    try:
+        # naming the GzipFile after the final path keeps it out of the gzip header
+        with open(tmp_outpath, 'wb', buffering=_WRITE_BUFFER_SIZE) as fh, \
+                open(tmp_gz_outpath, 'wb') as gz_fh, \
+                gzip.GzipFile(gz_outpath, 'wb', compresslevel=6, fileobj=gz_fh, mtime=0) as gz:
+            fh_write = fh.write
+            gz_write = gz.write
+
+            def write(chunk):
+                fh_write(chunk)
+                gz_write(chunk)
+
+            write(_CHANNEL_PREFIX)
+
+            # Add items as they arrive from the AMO API; bind the per-item
+            # callable to a local to skip the global lookup in the loop
+            build_item = _build_item
+            for addon in addons:
+                write(build_item(addon, pub_dates))
+                items_count += 1
+
+            write(_CHANNEL_SUFFIX)
+    except BaseException:
+        _discard_tmp()
+        raise
+
+    # A page that failed to load leaves the feed incomplete; keep the previous
+    # one rather than replacing it with a partial result
+    if fetch_failed:
+        _discard_tmp()
+        print(f"Could not fetch all AMO results; keeping {outpath}")
+        return
+    os.replace(tmp_outpath, outpath)
+    os.replace(tmp_gz_outpath, gz_outpath)
 
     # Summary information
-    items_count = len(addons)
     newest_pub = None
     if pub_dates:
         newest_pub = max(pub_dates).astimezone(timezone.utc)
 
-    if not amo_type:
-        default_outpath = os.path.join(outdir, 'amo_latest_addons.xml')
-        tree.write(default_outpath, encoding="utf-8", xml_declaration=True)
+    if amo_type:
         if newest_pub:
-            print(f"RSS feed generated: {default_outpath} (items={items_count}, newest_pubDate={newest_pub.isoformat()})")
+            print(f"Type-specific RSS feed generated: {outpath} (items={items_count}, newest_pubDate={newest_pub.isoformat()})")
         else:
-            print(f"RSS feed generated: {default_outpath} (items={items_count})")
-
-    # Always write a type-specific file when `amo_type` is provided
-    if amo_type:
-        safe_label = ''.join(ch for ch in str(file_label or amo_type) if ch.isalnum() or ch in ('_', '-')).lower()
-        type_outpath = os.path.join(outdir, f'amo_latest_{safe_label}s.xml')
-        tree.write(type_outpath, encoding="utf-8", xml_declaration=True)
+            print(f"Type-specific RSS feed generated: {outpath} (items={items_count})")
+    else:
         if newest_pub:
-            print(f"Type-specific RSS feed generated: {type_outpath} (items={items_count}, newest_pubDate={newest_pub.isoformat()})")
+            print(f"RSS feed generated: {outpath} (items={items_count}, newest_pubDate={newest_pub.isoformat()})")
         else:
-            print(f"Type-specific RSS feed generated: {type_outpath} (items={items_count})")
+            print(f"RSS feed generated: {outpath} (items={items_count})")
 
-    # Optional freshness check controlled by AMO_MAX_STALE_HOURS (hours)
-    max_stale = os.environ.get('AMO_MAX_STALE_HOURS')
-    if max_stale:
-        try:
-            hours = float(max_stale)
-            if newest_pub:
-                age_hours = (datetime.now(timezone.utc) - newest_pub).total_seconds() / 3600.0
-                if age_hours > hours:
-                    print(f"ERROR: feed newest pubDate {newest_pub.isoformat()} is older than {hours} hours (age {age_hours:.1f}h).")
-                    sys.exit(2)
-        except Exception as e:
-            print(f"Could not evaluate AMO_MAX_STALE_HOURS: {e}")
+    # Validators are only saved here, after a complete feed was written
+    if validators is not None:
+        _save_http_cache(cache_path, dict(validators, url=first_url, newest_pub=newest_pub.isoformat() if newest_pub else None, **cache_key))
+
+    _check_freshness(newest_pub)
 
 
 def _env_or_arg():
     parser = argparse.ArgumentParser(description='Generate AMO RSS feeds')
     parser.add_argument('--search-url', help='Full AMO API search URL to use (overrides other params)')
     parser.add_argument('--type', dest='amo_type', help='AMO type parameter (e.g. extension or theme)')
+    parser.add_argument('--types', help='Comma-separated AMO types to generate feeds for in parallel (e.g. extension,theme)')
     parser.add_argument('--q', help='Search query (q param)')
     parser.add_argument('--page-size', type=int, default=50, help='Number of results to fetch per page')
     parser.add_argument('--max-items', type=int, default=200, help='Maximum total number of items to fetch (across pages)')
@@ -496,10 +860,27 @@ def _env_or_arg():
     page_size = args.page_size or int(os.environ.get('AMO_PAGE_SIZE', '50'))
     max_items = args.max_items or int(os.environ.get('AMO_MAX_ITEMS', '200'))
     max_days = args.max_days or int(os.environ.get('AMO_MAX_DAYS', '0'))
+    types = [t.strip() for t in (args.types or os.environ.get('AMO_TYPES') or '').split(',') if t.strip()]
 
-    return search_url, amo_type, q, page_size, max_items, (max_days if max_days > 0 else None)
+    return search_url, amo_type, q, page_size, max_items, (max_days if max_days > 0 else None), types
 
 
 if __name__ == "__main__":
-    search_url, amo_type, q, page_size, max_items, max_days = _env_or_arg()
-    generate_rss_feed(search_url=search_url, amo_type=amo_type, q=q, page_size=page_size, max_items=max_items, max_days=max_days)
+    search_url, amo_type, q, page_size, max_items, max_days, types = _env_or_arg()
+    if types:
+        # Aliases (eg. "theme,themes") write the same file, so keep only the
+        # first type per output label; every remaining type writes its own
+        # file, so feeds can be generated concurrently. Threads overlap the
+        # AMO round-trips and share the pooled session.
+        by_label = {}
+        for t in types:
+            by_label.setdefault(_normalize_type(t)[1], t)
+        types = list(by_label.values())
+
+        def _generate(t):
+            generate_rss_feed(search_url=search_url, amo_type=t, q=q, page_size=page_size, max_items=max_items, max_days=max_days)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(types))) as ex:
+            list(ex.map(_generate, types))
+    else:
+        generate_rss_feed(search_url=search_url, amo_type=amo_type, q=q, page_size=page_size, max_items=max_items, max_days=max_days)
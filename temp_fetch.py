@@ -1,9 +1,11 @@
 import requests
 url = "https://addons.mozilla.org/api/v5/addons/search/?sort=updated&page_size=50&type=extension"
+session = requests.Session()
+session.headers.update({"User-Agent":"amo-test"})
 collected = []
 while url:
     print("fetch", url)
-    r = requests.get(url, headers={"User-Agent":"amo-test"}, timeout=30)
+    r = session.get(url, timeout=30)
     print("status", r.status_code)
     j = r.json()
     results = j.get("results", [])
@@ -1,5 +1,8 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 headers={'User-Agent':'amo-addons-rss/1.0'}
+session=requests.Session()
+session.headers.update(headers)
 urls=[
  'https://addons.mozilla.org/api/v5/addons/?sort=-last_updated&page_size=20',
  'https://addons.mozilla.org/api/v5/addons/addon/?sort=created&page_size=20',
@@ -8,11 +11,19 @@ urls=[
  'https://addons.mozilla.org/api/v5/addons/search/?sort=created&page_size=20',
  'https://addons.mozilla.org/api/v5/addons/addon/?page_size=20'
 ]
-for u in urls:
+
+def probe(u):
     try:
-        r=requests.get(u,headers=headers,timeout=10)
+        return session.get(u,timeout=10)
+    except Exception as e:
+        return e
+
+# fire all probes at once; results still print in list order
+with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+    for u, r in zip(urls, ex.map(probe, urls)):
+        if isinstance(r, Exception):
+            print('err',u,r)
+            continue
         print(u, r.status_code)
         if r.status_code==200:
             print(r.text[:200])
-    except Exception as e:
-        print('err',u,e)